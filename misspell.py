@@ -30,7 +30,14 @@ default config file for a complete guide.
 """
 
 import argparse
+import collections
+import concurrent.futures
 import configparser
+import functools
+import io
+import itertools
+import math
+import os
 import pathlib
 import random
 import re
@@ -130,14 +137,32 @@ _VOWELS = "aeiou"
 _CONSONANTS = "bcdfghjklmnpqrstvwxyz"
 _KEYBOARD = ["1234567890", "qwertyuiop", "asdfghjkl;", "zxcvbnm,./",
              "!@#$%^&*()", "QWERTYUIOP", "ASDFGHJKL:", "ZXCVBNM<>?"]
+_KEY_POS = {c: (row, col) for (row, keys) in enumerate(_KEYBOARD)
+            for (col, c) in enumerate(keys)} # (row, column) of each key
+_VOWEL_CHARS = frozenset(_VOWELS)
+_CONSONANT_CHARS = frozenset(_CONSONANTS)
 _COS45 = 0.70710678
+_PUNCTUATION = "!@#$%^&*()_-+=[]{}\\|;:'\",.<>/?`~"
 _BLOCKS = ("c", "v", "vc", "c_b", "v_w", "cv_w")
+_BLOCK_SECTIONS = {"c": ("c",), "v": ("v",), "vc": ("c", "v", "vc"),
+                   "c_b": ("c", "c_b"), "v_w": ("v", "v_w"),
+                   "cv_w": ("c", "v", "cv_w")} # rule sections for each block
 _PHONO_CUTOFF = 20 # max number of phonological misspell attempts per letter
+_BLOCK_CACHE_SIZE = 1 << 16 # max number of words with cached syllable blocks
+_FILE_BUFFER = 1 << 20 # buffer size (bytes) for reading and writing files
+_FILE_CHUNK = 1 << 16 # characters of file lines sent to a worker at once
+_CLUSTER_RE = re.compile("(["+_VOWELS+_VOWELS.upper()+"]+)|(["+_CONSONANTS+
+                         _CONSONANTS.upper()+"]+)") # consonant/vowel split
+_TOKEN_RE = re.compile(r"(\s+)|(\S+)") # whitespace/word run split
+_INI_SECTION_RE = re.compile(r"\[(.+)\]$") # INI section header
+_INI_OPTION_RE = re.compile(r"(.*?)\s*(?:[=:]\s*(.*))?$") # INI key/value
 
 # Define default global parameters
 _DEF_CONFIG = "settings.ini" # currently-loaded config file name
 _DEF_DATA = "data" # data file directory
 _DEF_RULES = "rules.ini" # phonological rule file name
+_RULES_PATH = str(pathlib.PurePath(__file__).parent / _DEF_DATA /
+                  _DEF_RULES) # full path to phonological rule file
 _DEF_BLACKLIST = () # words to prevent the program from accidentally creating
 _DEF_TYPO_DELETE_SPACE = 0.005 # chance to delete any whitespace character
 _DEF_TYPO_SWAP = 0.0075 # chance to swap consecutive characters
@@ -152,6 +177,7 @@ _DEF_PHONO_GROUP = 0.75 # chance to group potentially-groupable characters
 # Set global parameters to default values
 _CONFIG = _DEF_CONFIG
 _BLACKLIST = _DEF_BLACKLIST
+_BLACKLIST_RE = None # pattern matching any blacklisted word (None if empty)
 _TYPO_DELETE_SPACE = _DEF_TYPO_DELETE_SPACE
 _TYPO_SWAP = _DEF_TYPO_SWAP
 _TYPO_DELETE_CHAR = _DEF_TYPO_DELETE_CHAR
@@ -162,6 +188,19 @@ _PHONO_INSERT = _DEF_PHONO_INSERT
 _PHONO_REPLACE = _DEF_PHONO_REPLACE
 _PHONO_GROUP = _DEF_PHONO_GROUP
 
+# Whether the default config file is known to exist
+_DEF_CONFIG_FOUND = False
+
+# Initialize cache of parsed INI files (keyed by path, with each file's
+# modification time stored alongside its contents)
+_INI_CACHE = {}
+
+# Most recently processed phonological rules (set by _read_rules)
+_RULES = None
+
+# Phonological rules of a worker process (set by _init_worker)
+_WORKER_RULES = None
+
 # Set global character sets to default values
 _VOWEL_SET = tuple(_VOWELS)
 _CONSONANT_SET = tuple(_CONSONANTS)
@@ -170,6 +209,127 @@ _CONSONANT_SET = tuple(_CONSONANTS)
 # Misspelling algorithms
 #=============================================================================
 
+def _misspell_text(s, mode=0, rules=None, jobs=1):
+    """_misspell_text(s[, mode][, rules][, jobs]) -> str
+    Misspells a string of text, which may contain several lines.
+    
+    This is the core of misspell_string, which can be called directly once
+    its arguments have been validated and the necessary config and rules
+    have been loaded.
+    
+    Positional arguments:
+    s (str) -- string to be misspelled
+    
+    Keyword arguments:
+    [mode=0] (int) -- code for misspelling rules to apply (default 0 for all,
+        1 for phonological only, 2 for typographical only)
+    [rules=None] (dict) -- dictionary of phonological misspelling rule
+        sections, containing dictionaries of forbidden substrings and letter
+        groups
+    [jobs=1] (int) -- number of worker processes used to misspell separate
+        lines in parallel
+    
+    Returns:
+    (str) -- misspelled version of string
+    """
+    
+    # Translate line-by-line (in parallel if requested)
+    lines = s.split('\n') # input lines
+    if jobs > 1 and len(lines) > 1:
+        chunk = max(1, len(lines)//(4*jobs)) # lines sent to a worker at once
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker,
+            initargs=(_get_params(), rules)) as ex:
+            out_lines = list(ex.map(_worker_line, lines,
+                                    itertools.repeat(mode), chunksize=chunk))
+    else:
+        out_lines = [_misspell_line(line, mode=mode, rules=rules)
+                     for line in lines]
+    
+    # Combine lines
+    out_text = "\n".join(out_lines) # complete output string
+    
+    # Run a final check for blacklisted words
+    if _BLACKLIST_RE != None:
+        # Delete the last character of each match until none remain
+        n = 1 # number of matches in the most recent pass
+        while n > 0:
+            (out_text, n) = _BLACKLIST_RE.subn(lambda m: m.group()[:-1],
+                                               out_text)
+    
+    return out_text
+
+#-----------------------------------------------------------------------------
+
+def _misspell_line(line, mode=0, rules=None):
+    """_misspell_line(line[, mode][, rules]) -> str
+    Misspells a single line of text.
+    
+    Each word and whitespace run of the line is misspelled individually, and
+    the results are assembled into the line in a single pass which also
+    applies random swaps between adjacent characters. Lines are independent
+    of each other, which allows them to be processed in parallel.
+    
+    Positional arguments:
+    line (str) -- line to be misspelled (without a newline character)
+    
+    Keyword arguments:
+    [mode=0] (int) -- code for misspelling rules to apply (default 0 for all,
+        1 for phonological only, 2 for typographical only)
+    [rules=None] (dict) -- dictionary of phonological misspelling rule
+        sections, containing dictionaries of forbidden substrings and letter
+        groups
+    
+    Returns:
+    (str) -- misspelled version of line
+    """
+    
+    # Translate word-by-word
+    pieces = [] # misspelled words and whitespace runs
+    for (space, word) in _tokenize(line):
+        if space == True:
+            # Chance to delete whitespace
+            if mode in {0, 2}:
+                pieces.append(_delete_space(word))
+            else:
+                pieces.append(word)
+        else:
+            # Misspell word
+            pieces.append(_misspell_word(word, mode=mode, rules=rules))
+    
+    # Skip swaps for phonological misspelling or if swaps are disabled
+    if mode == 1 or _TYPO_SWAP <= 0:
+        return "".join(pieces)
+    
+    # Assemble the line while applying random character swaps
+    skip = _geometric_skip(_TYPO_SWAP) # compatible pairs left before a swap
+    classes = _CHAR_CLASS # local alias for the character class table
+    buf = [] # characters of output line
+    prev = 0 # swap class of the last character in the buffer
+    for piece in pieces:
+        for c in piece:
+            # Classify the character (see _char_class)
+            o = ord(c)
+            if o < 256:
+                k = classes[o]
+            else:
+                k = _char_class(c)
+            # Count down to a swap with the previous character if compatible
+            if k != 0 and k == prev:
+                if skip == 0:
+                    # (the swapped-back character shares the same class)
+                    buf.append(buf[-1])
+                    buf[-2] = c
+                    skip = _geometric_skip(_TYPO_SWAP)
+                    continue
+                skip -= 1
+            buf.append(c)
+            prev = k
+    
+    return "".join(buf)
+
+#-----------------------------------------------------------------------------
+
 def _misspell_word(w, mode=0, rules=None):
     """_misspell_word(w[, mode][, rules]) -> str
     Misspells a single word string.
@@ -184,41 +344,29 @@ def _misspell_word(w, mode=0, rules=None):
     Keyword arguments:
     [mode=0] (int) -- code for misspelling rules to apply (default 0 for all,
         1 for phonological only, 2 for typographical only)
-    [rules=None] (configparser.ConfigParser) -- config parser for phonological
-        misspelling rules, containing dictionaries of forbidden substrings and
-        letter groups
+    [rules=None] (dict) -- dictionary of phonological misspelling rule
+        sections, containing dictionaries of forbidden substrings and letter
+        groups
     
     Returns:
     (str) -- misspelled version of word
     """
     
-    # Validate input
-    if type(w) != str:
-        return w
-    if mode not in {0, 1, 2}:
-        mode = 0
-    if type(rules) != type(configparser.ConfigParser()) and rules != None:
-        rules = None
-    
     # Special typographical procedures for whitespace
-    w0 = w # post-whitespace deletion string
     if w.isspace() == True:
         if mode in {0, 2}:
-            w0 = ""
-            # Chance to randomly delete whitespace characters
-            for c in w:
-                if random.random() < 1.0 - _TYPO_DELETE_SPACE:
-                    w0 += c
-        return w0
+            return _delete_space(w)
+        return w
     
     # Apply phonological rules
-    w1 = w0 # post-phonological misspelling string
+    w1 = w # post-phonological misspelling string
     if mode in {0, 1}:
 
         # Split word into syllable blocks with categories
         (blocks, cats) = _word_blocks(w)
 
         # Process each block
+        roll = random.random # local alias for random draws
         prev_group = False # whether a letter group spans to the previous block
         for i in range(len(blocks)):
             # Skip non-letter blocks
@@ -240,7 +388,8 @@ def _misspell_word(w, mode=0, rules=None):
                   and blocks[i][1:].islower() == True):
                 cap = 2 # first letter capitalized
             # Normalize capitalization
-            blocks[i] = blocks[i].lower()
+            if cap != 0:
+                blocks[i] = blocks[i].lower()
             # Check for letter groups on the boundary between blocks
             fst = False # whether to preserve the first character
             lst = False # whether to preserve the last character
@@ -248,7 +397,7 @@ def _misspell_word(w, mode=0, rules=None):
                 if (i < len(blocks) - 1 and (blocks[i][-1] + blocks[i+1][0])
                     in rules["group"]):
                     # Randomly decide whether to pair the characters
-                    if random.random() < _PHONO_GROUP:
+                    if roll() < _PHONO_GROUP:
                         prev_group = True
                         lst = True
                     else:
@@ -260,16 +409,11 @@ def _misspell_word(w, mode=0, rules=None):
             # Transform block
             blocks[i] = _misspell_block(blocks[i], cats[i], rules=rules,
                                         preserve=(fst, lst))
-            # Apply capitalization
-            if cap == 0:
-                blocks[i] = blocks[i].lower()
-            elif cap == 1:
+            # Apply capitalization (the block is returned in lowercase)
+            if cap == 1:
                 blocks[i] = blocks[i].upper()
             elif cap == 2:
-                if len(blocks[i]) > 1:
-                    blocks[i] = blocks[i][0].upper() + blocks[i][1:].lower()
-                else:
-                    blocks[i] = blocks[i].upper()
+                blocks[i] = blocks[i].capitalize()
 
         # Re-combine blocks into a word
         w1 = "".join(blocks)
@@ -278,34 +422,104 @@ def _misspell_word(w, mode=0, rules=None):
     if mode in {0, 2}:
         
         # Chance to randomly delete, insert, or mistype a character
-        w2 = "" # post-typographical misspelling string
-        for c in w1:
-            # Select a random type of mistake (or none)
-            rand = random.random()
-            if rand < _TYPO_DELETE_CHAR:
-                # Delete character (omit from output string)
-                continue
-            elif rand < _TYPO_DELETE_CHAR + _TYPO_INSERT:
-                # Insert an extra character (randomly select left or right)
-                if random.random() < 0.5:
-                    w2 += _mistype_key(c) + c
-                else:
-                    w2 += c + _mistype_key(c)
-            elif rand < _TYPO_DELETE_CHAR + _TYPO_INSERT + _TYPO_REPLACE:
-                # Replace character
-                w2 += _mistype_key(c)
-            else:
-                # If no error, include unedited character
-                w2 += c
-        
-        # Return final result
-        return w2
+        return _typo_pass(w1)
     
     # Otherwise simply return phonological result
     return w1
 
 #-----------------------------------------------------------------------------
 
+def _delete_space(w):
+    """_delete_space(w) -> str
+    Randomly deletes characters from a whitespace string.
+    
+    Positional arguments:
+    w (str) -- whitespace string
+    
+    Returns:
+    (str) -- whitespace string with some characters possibly removed
+    """
+    
+    # Chance to randomly delete whitespace characters
+    if _TYPO_DELETE_SPACE <= 0:
+        return w
+    
+    # Jump from one deleted character to the next, keeping the runs between
+    parts = [] # kept pieces of whitespace string
+    i = 0 # start of current kept run
+    j = _geometric_skip(_TYPO_DELETE_SPACE) # index of next deleted character
+    while j < len(w):
+        parts.append(w[i:j])
+        i = j + 1
+        j = i + _geometric_skip(_TYPO_DELETE_SPACE)
+    if i == 0:
+        return w
+    parts.append(w[i:])
+    return "".join(parts)
+
+#-----------------------------------------------------------------------------
+
+def _typo_pass(w):
+    """_typo_pass(w) -> str
+    Applies random character deletions, insertions, and replacements.
+    
+    Rather than rolling for a mistake at every character, the gap until the
+    next mistaken character is drawn directly from a geometric distribution,
+    after which the type of mistake is chosen in proportion to its
+    probability. Random numbers are only drawn for the (few) characters that
+    actually change, while the unedited runs between them are copied as
+    slices.
+    
+    Positional arguments:
+    w (str) -- string to be typographically misspelled
+    
+    Returns:
+    (str) -- misspelled version of string
+    """
+    
+    # Bind the mistake chances locally and total them for any given character
+    p_del = _TYPO_DELETE_CHAR # chance to delete a character
+    p_ins = p_del + _TYPO_INSERT # cutoff for inserting a character
+    p = p_ins + _TYPO_REPLACE # chance for a character to be mistyped
+    if p <= 0:
+        return w
+    
+    # Replacement-only configurations need no roll for the type of mistake
+    replace_only = p_ins == 0
+    
+    # Jump from one mistaken character to the next
+    roll = random.random # local alias for random draws
+    parts = [] # pieces of post-typographical misspelling string
+    i = 0 # start of current unedited run
+    j = _geometric_skip(p) # index of next mistaken character
+    while j < len(w):
+        parts.append(w[i:j])
+        c = w[j]
+        # Select the type of mistake
+        rand = p
+        if replace_only == False:
+            rand *= roll()
+        if rand < p_del:
+            # Delete character (omit from output string)
+            pass
+        elif rand < p_ins:
+            # Insert an extra character (randomly select left or right)
+            if roll() < 0.5:
+                parts.append(_mistype_key(c) + c)
+            else:
+                parts.append(c + _mistype_key(c))
+        else:
+            # Replace character
+            parts.append(_mistype_key(c))
+        i = j + 1
+        j = i + _geometric_skip(p)
+    parts.append(w[i:])
+    
+    # Return final result
+    return "".join(parts)
+
+#-----------------------------------------------------------------------------
+
 def _misspell_block(s, cat, rules=None, preserve=(False, False)):
     """_misspell_block(s, cat[, rules][, preserve]) -> str
     Misspells a single letter block.
@@ -317,12 +531,12 @@ def _misspell_block(s, cat, rules=None, preserve=(False, False)):
     Positional arguments:
     s (str) -- syllable to be misspelled
     cat (str) -- categorization of the given syllable, as a section in the
-        'rules' config parser
+        'rules' dictionary
     
     Keyword arguments:
-    [rules=None] (configparser.ConfigParser) -- config parser for phonological
-        misspelling rules, containing dictionaries of forbidden substrings and
-        letter groups
+    [rules=None] (dict) -- dictionary of phonological misspelling rule
+        sections, containing dictionaries of forbidden substrings and letter
+        groups
     [preserve=(False, False)] (tuple(bool)) -- flags indicating whether to
         preserve the first and last characters (2-tuple of first/last order,
         True to preserve character and False otherwise)
@@ -331,19 +545,20 @@ def _misspell_block(s, cat, rules=None, preserve=(False, False)):
     (str) -- misspelled syllable
     """
     
-    # Validate input
-    if type(s) != str:
-        return s
-    if type(cat) != str:
-        cat = ""
-    if type(rules) != type(configparser.ConfigParser()) and rules != None:
-        rules = None
-    if (type(preserve) != tuple or len(preserve) != 2 or
-        type(preserve[0]) != bool or type(preserve[1]) != bool):
-        preserve = (False, False)
+    # Normalize capitalization
     s = s.lower()
 
-    # Go through each character
+    # Go through each character, counting down to the next one to change
+    p_del = _PHONO_DELETE # chance to delete a character
+    p_ins = p_del + _PHONO_INSERT # cutoff for inserting a character
+    p = p_ins + _PHONO_REPLACE # chance of a change
+    if p <= 0:
+        return s
+    skip = _geometric_skip(p) # characters left before the next change
+    groups = rules["group"] # letter groups
+    forbidden = rules["forbidden"].get(cat, (frozenset(), ())) # rule table
+    roll = random.random # local alias for random draws
+    choose = random.choice # local alias for random selections
     i = -1 # current character index
     valid = False # whether a valid replacement was made
     while i < len(s) - 1:
@@ -360,12 +575,18 @@ def _misspell_block(s, cat, rules=None, preserve=(False, False)):
 
         # Determine whether to group characters
         if len(s) > 1:
-            if i < len(s) - 1 and s[i:i+2] in rules["group"]:
+            if i < len(s) - 1 and s[i:i+2] in groups:
                 # Randomly decide whether to pair the characters
-                if random.random() < _PHONO_GROUP:
+                if roll() < _PHONO_GROUP:
                     c = s[i:i+2]
                     i += 1
 
+        # Leave the character unchanged until the countdown runs out
+        if skip > 0:
+            skip -= 1
+            continue
+        skip = _geometric_skip(p)
+
         # Attempt a valid transformation up to a cutoff limit
         tries = 0
         while tries < _PHONO_CUTOFF:
@@ -373,40 +594,44 @@ def _misspell_block(s, cat, rules=None, preserve=(False, False)):
             sn = s # new version of string
             di = 0 # index offset from proposed change
 
-            # Chance to randomly delete, insert, or replace a character
-            rand = random.random()
-            if rand < _PHONO_DELETE and len(s) > 1:
+            # Chance to randomly delete, insert, or replace a character (the
+            # first try is known to make some change)
+            if tries == 1:
+                rand = p*roll()
+            else:
+                rand = roll()
+            if rand < p_del and len(s) > 1:
                 # Delete character
                 sn = sn[:max(0,i-len(c)+1)] + sn[i+1:]
                 di = 1 - len(c)
-            elif rand < _PHONO_DELETE + _PHONO_INSERT:
+            elif rand < p_ins:
                 # Pick a random character to insert on left or right
                 nc = "" # new character
                 # Randomly select left or right
-                if random.random() < 0.5:
+                if roll() < 0.5:
                     # Pick character to match left side
-                    if c[0] in _CONSONANTS:
-                        nc = random.choice(_CONSONANT_SET)
+                    if c[0] in _CONSONANT_CHARS:
+                        nc = choose(_CONSONANT_SET)
                     else:
-                        nc = random.choice(_VOWEL_SET)
+                        nc = choose(_VOWEL_SET)
                     # Insert character on left
                     sn = sn[:max(0,i-len(c)+1)] + nc + sn[i-len(c)+1:]
                 else:
                     # Pick character to match right side
-                    if c[-1] in _CONSONANTS:
-                        nc = random.choice(_CONSONANT_SET)
+                    if c[-1] in _CONSONANT_CHARS:
+                        nc = choose(_CONSONANT_SET)
                     else:
-                        nc = random.choice(_VOWEL_SET)
+                        nc = choose(_VOWEL_SET)
                     # Insert character on right
                     sn = sn[:i+1] + nc + sn[i+1:]
                 di = len(nc)
-            elif rand < _PHONO_DELETE + _PHONO_INSERT + _PHONO_REPLACE:
+            elif rand < p:
                 # Pick a random replacement character
                 nc = "" # new character
-                if c[0] in _CONSONANTS:
-                    nc = random.choice(_CONSONANT_SET)
+                if c[0] in _CONSONANT_CHARS:
+                    nc = choose(_CONSONANT_SET)
                 else:
-                    nc = random.choice(_VOWEL_SET)
+                    nc = choose(_VOWEL_SET)
                 # Replace character
                 sn = sn[:max(0,i-len(c)+1)] + nc + sn[i+1:]
                 di = len(nc) - len(c)
@@ -414,65 +639,15 @@ def _misspell_block(s, cat, rules=None, preserve=(False, False)):
                 # Otherwise do nothing
                 break
 
-            # Verify that substring is valid
+            # Verify all rules for the block category at once
             valid = True
-            if "c" in cat:
-                # Verify all consonant rules
-                for r in rules["c"]:
-                    if r in sn:
-                        valid = False
-                        break
-                if valid == False:
-                    continue
-                # Consonant at beginning
-                if cat == "c_b":
-                    for r in rules["c_b"]:
-                        if r in sn:
-                            valid = False
-                            break
-                    if valid == False:
-                        continue
-            if "v" in cat:
-                # Verify all vowel rules
-                for r in rules["v"]:
-                    if r in sn:
-                        valid = False
-                        break
-                if valid == False:
-                    continue
-                # Vowel word
-                if cat == "v_w":
-                    for r in rules["v_w"]:
-                        if r in sn:
-                            valid = False
-                            break
-                    if valid == False:
-                        continue
-                # Don't allow all vowels to be removed
-                no_vowels = True
-                for v in sn:
-                    if v in _VOWELS:
-                        no_vowels = False
-                        break
-                if no_vowels == True:
-                    valid = False
-                    continue
-            if cat == "vc":
-                # Verify VC block rules
-                for r in rules["vc"]:
-                    if r in sn:
-                        valid = False
-                        break
-                if valid == False:
-                    continue
-            elif cat == "cv_w":
-                # Verify CV word rules
-                for r in rules["cv_w"]:
-                    if r in sn:
-                        valid = False
-                        break
-                if valid == False:
-                    continue
+            if _has_forbidden(sn, forbidden) == True:
+                valid = False
+                continue
+            # Don't allow all vowels to be removed
+            if "v" in cat and _VOWEL_CHARS.isdisjoint(sn) == True:
+                valid = False
+                continue
 
             # If all tests are passed, the substring is valid
             valid = True
@@ -516,107 +691,153 @@ def _word_blocks(w):
         corresponding list of categories for each syllable
     """
 
-    # Validate input
-    if type(w) != str:
-        return w
+    # Copy the (cached) partition so that callers may edit it
+    (blocks, cats) = _split_blocks(w)
+    return (list(blocks), list(cats))
+
+#-----------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=_BLOCK_CACHE_SIZE)
+def _split_blocks(w):
+    """_split_blocks(w) -> (tuple, tuple)
+    Divides a word into syllable blocks (with categories).
+
+    Computes the partition returned by _word_blocks. The result depends only
+    on the word itself, so it is cached for repeated words.
+
+    Positional arguments:
+    w (str) -- word to split
+
+    Returns:
+    (tuple, tuple) -- tuple of the syllable block tuple followed by a
+        corresponding tuple of categories for each syllable
+    """
 
-    # Split string into consonant/vowel/other clusters
-    clusters = [x for x in re.split("(["+_VOWELS+"]+)|(["+_CONSONANTS+"]+)",
-                w, flags=re.IGNORECASE) if x]
+    # Split string into consonant/vowel/other clusters, classifying each by
+    # the group that matched it (the split alternates between unmatched text,
+    # vowel clusters, and consonant clusters)
+    clusters = [] # nonempty clusters
+    kinds = [] # "v" for vowel, "c" for consonant, or "n" for other clusters
+    for (k, x) in enumerate(_CLUSTER_RE.split(w)):
+        if x:
+            clusters.append(x)
+            kinds.append("nvc"[k % 3])
 
     # Initialize return lists
     blocks = []
     cats = []
 
+    # Precompute letter flags of each cluster
+    al = [x[0].isalpha() for x in clusters] # whether each cluster is letters
+    n = len(clusters)
+
     # Check for single-block words
-    if len(clusters) == 1 and clusters[0][0].lower() in _VOWELS:
-        return ([w], ["v_w"])
-    if (len(clusters) == 2 and clusters[0][0].lower() in _CONSONANTS
-        and clusters[1][0].lower() in _VOWELS):
-        return ([w], ["cv_w"])
+    if n == 1 and kinds[0] == "v":
+        return ((w,), ("v_w",))
+    if n == 2 and kinds[0] == "c" and kinds[1] == "v":
+        return ((w,), ("cv_w",))
 
     # Read through clusters in order
-    i = -1 # current cluster index
-    pbreak = False # whether the previous cluster is a break
-    nbreak = False # whether the next cluster is a break
-    c = "" # first character of current cluster
-    while i < len(clusters) - 1:
-        # Find current letter and whether it's against a break
-        i += 1
-        if i == 0 or clusters[i-1][0].isalpha() == False:
-            pbreak = True
-        else:
-            pbreak = False
-        if i == len(clusters) - 1 or clusters[i+1][0].isalpha() == False:
-            nbreak = True
-        else:
-            nbreak = False
-        c = clusters[i][0].lower()
+    skip = False # whether the current cluster was merged into the previous
+    for i, cluster in enumerate(clusters):
+        if skip == True:
+            skip = False
+            continue
+        # Find whether the current cluster is against a break
+        pbreak = i == 0 or al[i-1] == False # whether previous is a break
+        nbreak = i == n - 1 or al[i+1] == False # whether next is a break
+        c = kinds[i] # kind of current cluster
         # Consonant
-        if c in _CONSONANTS:
+        if c == "c":
             # Consonant at beginning
             if pbreak == True:
-                blocks.append(clusters[i])
+                blocks.append(cluster)
                 cats.append("c_b")
             # Other consonant
             else:
-                blocks.append(clusters[i])
+                blocks.append(cluster)
                 cats.append("c")
         # Vowel
-        elif c in _VOWELS:
+        elif c == "v":
             # Vowel followed by consonant
-            if nbreak == False and clusters[i+1][0].lower() in _CONSONANTS:
-                blocks.append(clusters[i] + clusters[i+1])
+            if nbreak == False and kinds[i+1] == "c":
+                blocks.append(cluster + clusters[i+1])
                 cats.append("vc")
-                i += 1
+                skip = True
             # Other vowel
             else:
-                blocks.append(clusters[i])
+                blocks.append(cluster)
                 cats.append("v")
         # Non-letter
         else:
-            blocks.append(clusters[i])
+            blocks.append(cluster)
             cats.append("n")
 
-    # Return lists
-    return (blocks, cats)
+    # Return tuples
+    return (tuple(blocks), tuple(cats))
 
 #-----------------------------------------------------------------------------
 
-def _can_swap(c1, c2):
-    """_can_swap(c1, c2) -> bool
-    Defines whether a given pair of characters can swap.
+def _has_forbidden(s, table):
+    """_has_forbidden(s, table) -> bool
+    Determines whether a string contains a forbidden substring.
+
+    Rather than searching the string for each of the (many) forbidden
+    substrings in turn, every window of the string whose length matches that
+    of some forbidden substring is looked up in a precomputed set, which
+    requires only a few set lookups per character.
+
+    Positional arguments:
+    s (str) -- string to check
+    table (tuple) -- forbidden substring table of a block category, as built
+        by _forbidden_tables (set of substrings with their distinct lengths)
+
+    Returns:
+    (bool) -- True if the string contains a forbidden substring, False
+        otherwise
+    """
+
+    # Check each window length against the set of forbidden substrings
+    (subs, lengths) = table
+    for n in lengths:
+        for k in range(len(s) - n + 1):
+            if s[k:k+n] in subs:
+                return True
+
+    # If no window matched, the string is allowed
+    return False
+
+#-----------------------------------------------------------------------------
+
+def _char_class(c):
+    """_char_class(c) -> int
+    Classifies a character for the purposes of swapping.
     
     One of the allowed types of typographical error is for two characters to
     switch position. This is allowed only when they are two letters of the
-    same case, or two numbers, or two punctuation marks.
+    same case, or two numbers, or two punctuation marks, which is to say when
+    they share the same nonzero class.
     
     Positional arguments:
-    c1 (str) -- first character
-    c2 (str) -- second character
+    c (str) -- character to classify
     
     Returns:
-    (bool) -- True if the swap is valid, False otherwise
+    (int) -- 1 for lowercase letters, 2 for uppercase letters, 3 for digits, 4
+        for punctuation marks, or 0 for anything else
     """
     
-    # Validate input
-    if ((type(c1) != str) or (type(c2) != str) or
-        (len(c1) > 1) or (len(c2) > 1)):
-        return False
-    
-    # Check for allowed combinations
-    if c1.islower() and c2.islower():
-        return True
-    if c1.isupper() and c2.isupper():
-        return True
-    if c1.isdigit() and c2.isdigit():
-        return True
-    p = "!@#$%^&*()_-+=[]{}\\|;:'\",.<>/?`~"
-    if (c1 in p) and (c2 in p):
-        return True
-    
-    # If all tests failed, the swap is not allowed
-    return False
+    if c.islower():
+        return 1
+    if c.isupper():
+        return 2
+    if c.isdigit():
+        return 3
+    if c in _PUNCTUATION:
+        return 4
+    return 0
+
+# Precompute the classes of all single-byte characters
+_CHAR_CLASS = bytes(_char_class(chr(i)) for i in range(256))
 
 #-----------------------------------------------------------------------------
 
@@ -635,21 +856,48 @@ def _mistype_key(c):
     (str) -- single character to replace the given character
     """
 
-    # Validate input
-    if (type(c) != str) or (len(c) != 1):
+    # Look up the precomputed neighbors of the key
+    entry = _KEY_NEIGHBORS.get(c)
+
+    # If the character is not on the keyboard, change nothing
+    if entry == None:
         return c
 
-    # Find the keyboard list to which the character belongs
-    row = 0 # row index (0-3 for lowercase row, 4-7 for uppercase row)
-    while (row <= 7) and (c not in _KEYBOARD[row]):
-        row += 1
+    # Randomly select an adjacent key
+    return random.choices(entry[0], cum_weights=entry[1])[0]
 
-    # If all rows passed without a match, change nothing
-    if row > 7:
-        return c
+#-----------------------------------------------------------------------------
+
+def _key_neighbors(c):
+    """_key_neighbors(c) -> (tuple, tuple)
+    Finds the keys adjacent to the specified key, along with their weights.
+
+    Used to build the neighbor table consulted by _mistype_key. Rectilinear
+    neighbors have a weight of 1 and diagonal neighbors have a weight of
+    sqrt(2)/2 ~= 0.707.
+
+    Positional arguments:
+    c (str) -- keyboard character
+
+    Returns:
+    (tuple, tuple) -- tuple of adjacent key characters followed by a
+        corresponding tuple of cumulative weights, or None if the character is
+        not on the keyboard
+    """
+
+    # Validate input
+    if (not isinstance(c, str)) or (len(c) != 1):
+        return None
+
+    # Find the row (0-3 for lowercase, 4-7 for uppercase) and column of the key
+    pos = _KEY_POS.get(c)
+
+    # If the character is not on the keyboard, there are no neighbors
+    if pos == None:
+        return None
 
     # Determine whether the key is on a boundary
-    col = _KEYBOARD[row].find(c) # column index
+    (row, col) = pos
     lb = False # left boundary
     if col == 0:
         lb = True
@@ -682,8 +930,11 @@ def _mistype_key(c):
     if not bb:
         choices[_KEYBOARD[row+1][col]] = 1
 
-    # Randomly select an adjacent key
-    return _dictionary_sample(choices)
+    # Return neighbors with cumulative weights
+    return (tuple(choices), tuple(itertools.accumulate(choices.values())))
+
+# Precompute the neighbors of every keyboard character
+_KEY_NEIGHBORS = {c: _key_neighbors(c) for row in _KEYBOARD for c in row}
 
 #=============================================================================
 # Resource file functions
@@ -708,13 +959,17 @@ def _read_config(fin, silent=False):
     global _CONFIG, _BLACKLIST, _TYPO_DELETE_SPACE, _TYPO_DELETE_CHAR
     global _TYPO_SWAP, _TYPO_INSERT, _TYPO_REPLACE
     global _PHONO_DELETE, _PHONO_INSERT, _PHONO_REPLACE, _PHONO_GROUP
-
-    # Generate default config if it does not exist
-    if pathlib.Path(_DEF_CONFIG).exists() == False:
-        _default_config(silent=silent)
+    global _BLACKLIST_RE
+    global _DEF_CONFIG_FOUND
+
+    # Generate default config if it does not exist (checked only once)
+    if _DEF_CONFIG_FOUND == False:
+        if pathlib.Path(_DEF_CONFIG).exists() == False:
+            _default_config(silent=silent)
+        _DEF_CONFIG_FOUND = True
     
     # Validate input
-    if type(fin) != str and fin != None:
+    if fin != None and not isinstance(fin, str):
         return None
 
     # Do nothing if input is None
@@ -734,9 +989,6 @@ def _read_config(fin, silent=False):
     if silent == False:
         print("Reading config file '" + fin + "' ...")
         
-    # Initialize config parser
-    config = configparser.ConfigParser(allow_no_value=True)
-
     # Verify that config file exists
     if pathlib.Path(fin).exists() == False:
         if silent == False:
@@ -744,21 +996,28 @@ def _read_config(fin, silent=False):
             print("Reverting to default parameters.")
         return _default_config(silent=silent)
 
-    # Read config file
-    config.read(fin)
+    # Read config file (or reuse its cached contents)
+    try:
+        config = _load_ini(fin)
+    except OSError:
+        if silent == False:
+            print("Config file '" + fin + "' could not be read.")
+            print("Reverting to default parameters.")
+        return _default_config(silent=silent)
     
     # Read typographical section
     try:
         key = "delete_space"
-        _TYPO_DELETE_SPACE = float(config["typo"][key])
+        typo = config["typo"] # section dictionary
+        _TYPO_DELETE_SPACE = float(typo[key])
         key = "delete_char"
-        _TYPO_DELETE_CHAR = float(config["typo"][key])
+        _TYPO_DELETE_CHAR = float(typo[key])
         key = "swap"
-        _TYPO_SWAP = float(config["typo"][key])
+        _TYPO_SWAP = float(typo[key])
         key = "insert"
-        _TYPO_INSERT = float(config["typo"][key])
+        _TYPO_INSERT = float(typo[key])
         key = "replace"
-        _TYPO_REPLACE = float(config["typo"][key])
+        _TYPO_REPLACE = float(typo[key])
     except KeyError:
         if silent == False:
             print("Key '" + key + "' from 'typo' section not found in '" +
@@ -799,13 +1058,14 @@ def _read_config(fin, silent=False):
     # Read phonological section
     try:
         key = "delete"
-        _PHONO_DELETE = float(config["phono"][key])
+        phono = config["phono"] # section dictionary
+        _PHONO_DELETE = float(phono[key])
         key = "insert"
-        _PHONO_INSERT = float(config["phono"][key])
+        _PHONO_INSERT = float(phono[key])
         key = "replace"
-        _PHONO_REPLACE = float(config["phono"][key])
+        _PHONO_REPLACE = float(phono[key])
         key = "group"
-        _PHONO_GROUP = float(config["phono"][key])
+        _PHONO_GROUP = float(phono[key])
     except KeyError:
         if silent == False:
             print("Key '" + key + "' from 'phono' section not found in '" +
@@ -842,10 +1102,11 @@ def _read_config(fin, silent=False):
         return _default_config(silent=silent)
 
     # Read blacklist (section not required)
-    if "blacklist" in config.sections():
-        _BLACKLIST = tuple(dict(config.items("blacklist")))
+    if "blacklist" in config:
+        _BLACKLIST = tuple(config["blacklist"])
     else:
         _BLACKLIST = _DEF_BLACKLIST
+    _BLACKLIST_RE = _blacklist_re(_BLACKLIST)
     
     if silent == False:
         print("Config file successfully loaded!")
@@ -868,6 +1129,7 @@ def _default_config(silent=False, comments=True):
     global _CONFIG, _BLACKLIST, _TYPO_DELETE_SPACE, _TYPO_DELETE_CHAR
     global _TYPO_SWAP, _TYPO_INSERT, _TYPO_REPLACE
     global _PHONO_DELETE, _PHONO_INSERT, _PHONO_REPLACE, _PHONO_GROUP
+    global _BLACKLIST_RE
 
     if silent == False:
         print("Resetting config file to default 'settings.ini' ...")
@@ -875,6 +1137,7 @@ def _default_config(silent=False, comments=True):
     # Reset all global parameters to their default values
     _CONFIG = _DEF_CONFIG
     _BLACKLIST = _DEF_BLACKLIST
+    _BLACKLIST_RE = _blacklist_re(_BLACKLIST)
     _TYPO_DELETE_SPACE = _DEF_TYPO_DELETE_SPACE
     _TYPO_SWAP = _DEF_TYPO_SWAP
     _TYPO_DELETE_CHAR = _DEF_TYPO_DELETE_CHAR
@@ -914,27 +1177,25 @@ def _default_config(silent=False, comments=True):
     config["blacklist"] = dic
     del dic
 
-    # Write config file
-    with open(_CONFIG, 'w') as f:
-        config.write(f)
+    # Get config contents
+    buf = io.StringIO() # in-memory copy of config text
+    config.write(buf)
+    text = buf.getvalue() # all text in config file
 
     # Write comment lines to beginning of file
     if comments == True:
-        text = "" # all text in config file
-
-        # Get config contents
-        with open(_CONFIG, 'r') as f:
-            text = f.read()
 
         # Write version info into comments
         version = ""
         for line in _VERSION.split("\n")[:-1]:
             version += "; " + line + "\n"
 
-        # Write version, comments, and config text to config file
+        # Prepend version and comments to config text
         text = version + _CONFIG_COMMENTS + "\n" + text
-        with open(_CONFIG, 'w') as f:
-            f.write(text)
+
+    # Write config file
+    with open(_CONFIG, 'w') as f:
+        f.write(text)
 
     if silent == False:
         print("Config file successfully reset!")
@@ -942,42 +1203,45 @@ def _default_config(silent=False, comments=True):
 #-----------------------------------------------------------------------------
 
 def _read_rules(silent=False):
-    """_read_rules() -> configparser.ConfigParser
+    """_read_rules() -> dict
     Reads the rules resource INI file for phonological misspelling rules.
 
     Keyword arguments:
     [silent=False] (bool) -- whether to print progress messages to the screen
     
     Returns:
-    (configparser.ConfigParser) -- parser object of phonological misspelling
-        rules, including forbidden substrings within different word blocks and
-        letter groups
+    (dict) -- dictionary of phonological misspelling rule sections, including
+        forbidden substrings within different word blocks and letter groups,
+        along with their merged tables for each block category under the
+        "forbidden" key (see _forbidden_tables)
     """
 
     # Global parameters to be edited
-    global _VOWEL_SET, _CONSONANT_SET
+    global _VOWEL_SET, _CONSONANT_SET, _RULES
 
     if silent == False:
         print("Reading phonological rule data ...")
 
-    # Define file path to data file
-    fin = pathlib.PurePath(__file__).parent / _DEF_DATA / _DEF_RULES
-
-    # Initialize data file parser
-    config = configparser.ConfigParser(allow_no_value=True)
-
-    # Verify that config file exists
-    if pathlib.Path(fin).exists() == False:
-        # If not, return an empty parser
+    # Read data file (or reuse its cached contents)
+    try:
+        config = _load_ini(_RULES_PATH)
+    except OSError:
+        # If not found (or unreadable), return empty rules
         if silent == False:
             print("Rule data not found. Ignoring phonological rules.")
+        config = {}
         config["group"] = {}
         for b in _BLOCKS:
             config[b] = {}
+        config["forbidden"] = _forbidden_tables(config)
+        _RULES = None
         return config
 
-    # Read data file
-    config.read(fin)
+    # Skip processing if the rules are unchanged since they were last read
+    if config is _RULES:
+        if silent == False:
+            print("Phonological rules loaded!")
+        return config
 
     # Verify that all needed fields are present
     if "group" not in config:
@@ -991,72 +1255,342 @@ def _read_rules(silent=False):
     _CONSONANT_SET = list(_CONSONANTS)
     for g in config["group"]:
         # Determine whether group is purely vowel or consonant
-        vow = True
-        con = True
-        for c in g:
-            if c not in _VOWELS:
-                vow = False
-            if c not in _CONSONANTS:
-                con = False
-        if vow == True:
+        if _VOWEL_CHARS.issuperset(g) == True:
             _VOWEL_SET.append(g)
-        if con == True:
+        if _CONSONANT_CHARS.issuperset(g) == True:
             _CONSONANT_SET.append(g)
     _VOWEL_SET = tuple(_VOWEL_SET)
     _CONSONANT_SET = tuple(_CONSONANT_SET)
 
+    # Create forbidden substring tables
+    config["forbidden"] = _forbidden_tables(config)
+
+    # Remember the processed rules
+    _RULES = config
+
     if silent == False:
         print("Phonological rules loaded!")
     
-    # Return the parser
+    # Return the rules
+    return config
+
+#-----------------------------------------------------------------------------
+
+def _forbidden_tables(rules):
+    """_forbidden_tables(rules) -> dict
+    Builds the forbidden substring tables for each block category.
+
+    Each table merges the forbidden substrings of all rule sections that
+    apply to the category (see _BLOCK_SECTIONS), together with their
+    distinct lengths, for use by _has_forbidden.
+
+    Positional arguments:
+    rules (dict) -- dictionary of phonological misspelling rule sections
+
+    Returns:
+    (dict) -- dictionary of (frozenset, tuple) tables of forbidden
+        substrings and their distinct lengths for each block category
+    """
+
+    tables = {}
+    for b in _BLOCKS:
+        subs = frozenset().union(*[rules.get(r, {})
+                                   for r in _BLOCK_SECTIONS[b]])
+        tables[b] = (subs, tuple(sorted({len(r) for r in subs})))
+    return tables
+
+#-----------------------------------------------------------------------------
+
+def _load_ini(fin):
+    """_load_ini(fin) -> dict
+    Reads an INI file, reusing the previous result if the file is unchanged.
+
+    Parsed files are cached by path along with their modification time, so
+    repeated calls to the public functions do not re-parse the same file. A
+    file modified since it was cached is parsed again, replacing its entry.
+
+    Positional arguments:
+    fin (str or pathlib.PurePath) -- INI file name
+
+    Returns:
+    (dict) -- dictionary of the file's sections, each a dictionary of keys
+        and values
+    """
+
+    # Look for cached contents of the current version of the file
+    key = str(fin) # file path
+    mtime = os.stat(fin).st_mtime_ns # modification time of file
+    if key not in _INI_CACHE or _INI_CACHE[key][0] != mtime:
+        # If not found or outdated, parse the file (replacing any old entry)
+        _INI_CACHE[key] = (mtime, _parse_ini(fin))
+
+    # Return the file contents
+    return _INI_CACHE[key][1]
+
+#-----------------------------------------------------------------------------
+
+def _parse_ini(fin):
+    """_parse_ini(fin) -> dict
+    Parses an INI file into a dictionary of sections.
+
+    This is a lightweight replacement for configparser's reader, which is
+    considerably slower on the large phonological rule file. It supports the
+    subset of INI syntax used by this module's files: section headers,
+    full-line comments beginning with '#' or ';', "key = value" (or
+    "key: value") lines, and keys without values. As with configparser, keys
+    are stripped and lowercased.
+
+    Positional arguments:
+    fin (str or pathlib.PurePath) -- INI file name
+
+    Returns:
+    (dict) -- dictionary of the file's sections, each a dictionary of keys
+        and values (None for keys without values)
+    """
+
+    config = {} # dictionary of sections
+    section = None # dictionary of current section
+    with open(fin, 'r') as f:
+        for line in f:
+            line = line.strip()
+            # Skip blank lines and comments
+            if len(line) == 0 or line[0] in "#;":
+                continue
+            # Begin a new section
+            m = _INI_SECTION_RE.match(line)
+            if m != None:
+                section = config.setdefault(m.group(1), {})
+                continue
+            # Ignore keys outside of any section
+            if section == None:
+                continue
+            # Read key and value
+            m = _INI_OPTION_RE.match(line)
+            section[m.group(1).lower()] = m.group(2)
+
+    # Return the dictionary of sections
     return config
 
 #=============================================================================
 # General utility functions
 #=============================================================================
 
-def _dictionary_sample(dic):
-    """_dictionary_sample(dic) -> key
-    Returns a weighted random sample key from a dictionary.
+def _geometric_skip(p):
+    """_geometric_skip(p) -> int
+    Returns the number of failed trials before a random event occurs.
+    
+    Sampling the gap between events from a geometric distribution is
+    equivalent to rolling for the event on every trial, but requires only a
+    single random number per event rather than one per trial.
+    
+    Positional arguments:
+    p (float) -- probability of the event occurring on any given trial
+    
+    Returns:
+    (int) -- number of trials to skip before the next event (effectively
+        infinite if the event is impossible)
+    """
+    
+    # Handle impossible and certain events
+    if p <= 0:
+        return sys.maxsize
+    if p >= 1:
+        return 0
+    
+    # Invert the geometric distribution's CDF (using log1p to keep precision
+    # for the very small chances typical of typographical mistakes)
+    return int(math.log1p(-random.random())/math.log1p(-p))
+
+#-----------------------------------------------------------------------------
+
+def _blacklist_re(words):
+    """_blacklist_re(words) -> re.Pattern
+    Compiles a pattern that matches any of a collection of words.
 
-    The dictionary is assumed to consist of key/weight pairs.
+    Matching is case-insensitive, so that a single scan of the output string
+    finds every occurrence of every blacklisted word.
 
     Positional arguments:
-    dic (dict) -- dictionary of key/weight pairs (weights given as floats)
+    words (tuple) -- words to match
 
     Returns:
-    (key) -- random key from dictionary
+    (re.Pattern) -- compiled pattern, or None if there are no words
     """
 
     # Validate input
-    if type(dic) != dict:
+    if len(words) == 0:
         return None
 
-    # Find total weight
-    total = 0.0
-    for key in dic:
-        total += dic[key]
+    return re.compile("|".join(re.escape(w) for w in words),
+                      flags=re.IGNORECASE)
 
-    # Select a random weight
-    rand = total*random.random()
+#-----------------------------------------------------------------------------
+
+def _get_params():
+    """_get_params() -> tuple
+    Gathers the currently-loaded misspelling parameters.
 
-    # Iterate through dictionary until passing this weight
-    total = 0.0
-    for key in dic:
-        total += dic[key]
-        if total >= rand:
-            return key
+    Used to copy the parent process's parameters into worker processes.
 
-    # Final stop for safety
-    return list(dic)[0]
+    Returns:
+    (tuple) -- tuple of global parameters, in the order expected by
+        _init_worker
+    """
+
+    return (_BLACKLIST, _TYPO_DELETE_SPACE, _TYPO_SWAP, _TYPO_DELETE_CHAR,
+            _TYPO_INSERT, _TYPO_REPLACE, _PHONO_DELETE, _PHONO_INSERT,
+            _PHONO_REPLACE, _PHONO_GROUP, _VOWEL_SET, _CONSONANT_SET)
+
+#-----------------------------------------------------------------------------
+
+def _init_worker(params, rules):
+    """_init_worker(params, rules)
+    Initializes a worker process for parallel misspelling.
+
+    Depending on the process start method, workers may not inherit the
+    parameters loaded by the parent process, so they are copied in
+    explicitly. The random number generator is also reseeded so that workers
+    forked from the same parent do not repeat each other's mistakes.
+
+    Positional arguments:
+    params (tuple) -- global parameters, as returned by _get_params
+    rules (dict) -- dictionary of phonological misspelling rule sections, or
+        None
+    """
+
+    # Global parameters to be edited
+    global _BLACKLIST, _TYPO_DELETE_SPACE, _TYPO_SWAP, _TYPO_DELETE_CHAR
+    global _TYPO_INSERT, _TYPO_REPLACE
+    global _PHONO_DELETE, _PHONO_INSERT, _PHONO_REPLACE, _PHONO_GROUP
+    global _VOWEL_SET, _CONSONANT_SET, _WORKER_RULES
+    global _BLACKLIST_RE
+
+    (_BLACKLIST, _TYPO_DELETE_SPACE, _TYPO_SWAP, _TYPO_DELETE_CHAR,
+     _TYPO_INSERT, _TYPO_REPLACE, _PHONO_DELETE, _PHONO_INSERT,
+     _PHONO_REPLACE, _PHONO_GROUP, _VOWEL_SET, _CONSONANT_SET) = params
+    _BLACKLIST_RE = _blacklist_re(_BLACKLIST)
+    _WORKER_RULES = rules
+    random.seed()
+
+#-----------------------------------------------------------------------------
+
+def _worker_line(line, mode):
+    """_worker_line(line, mode) -> str
+    Misspells a single line of text within a worker process.
+
+    Positional arguments:
+    line (str) -- line to be misspelled
+    mode (int) -- code for misspelling rules to apply
+
+    Returns:
+    (str) -- misspelled version of line
+    """
+
+    return _misspell_line(line, mode=mode, rules=_WORKER_RULES)
+
+#-----------------------------------------------------------------------------
+
+def _worker_string(s, mode):
+    """_worker_string(s, mode) -> str
+    Misspells a complete string within a worker process.
+
+    Unlike _worker_line, the string may contain newlines and is checked
+    against the blacklist, exactly as by misspell_string.
+
+    Positional arguments:
+    s (str) -- string to be misspelled
+    mode (int) -- code for misspelling rules to apply
+
+    Returns:
+    (str) -- misspelled version of string
+    """
+
+    return _misspell_text(s, mode=mode, rules=_WORKER_RULES)
+
+#-----------------------------------------------------------------------------
+
+def _pool_map(ex, blocks, mode, limit):
+    """_pool_map(ex, blocks, mode, limit) -> generator
+    Misspells blocks of text in worker processes, in order.
+
+    Blocks are only read from the input as earlier results are collected, so
+    that at most a fixed number are waiting in the pool at any time.
+
+    Positional arguments:
+    ex (concurrent.futures.Executor) -- worker process pool (initialized by
+        _init_worker)
+    blocks (iterable) -- iterable of strings to be misspelled
+    mode (int) -- code for misspelling rules to apply
+    limit (int) -- maximum number of blocks submitted to the pool at once
+
+    Returns:
+    (generator) -- generator of misspelled blocks, in the order given
+    """
+
+    pending = collections.deque() # futures of submitted blocks, in order
+    for text in blocks:
+        pending.append(ex.submit(_worker_string, text, mode))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while len(pending) > 0:
+        yield pending.popleft().result()
+
+#-----------------------------------------------------------------------------
+
+def _tokenize(s):
+    """_tokenize(s) -> list
+    Splits a string into its word and whitespace runs.
+
+    Positional arguments:
+    s (str) -- string to split
+
+    Returns:
+    (list) -- list of (bool, str) tuples for each run in order, with the
+        boolean being True for whitespace runs and False for word runs
+    """
+
+    return [(m.lastindex == 1, m.group()) for m in _TOKEN_RE.finditer(s)]
+
+#-----------------------------------------------------------------------------
+
+def _read_chunks(f, size=_FILE_BUFFER):
+    """_read_chunks(f[, size]) -> generator
+    Reads an open text file in large blocks of complete lines.
+
+    Each block is read with a single call and cut after its last newline,
+    with the remainder carried over to the next block, so that no line is
+    ever split between blocks.
+
+    Positional arguments:
+    f (file) -- open text file to read
+
+    Keyword arguments:
+    [size=_FILE_BUFFER] (int) -- number of characters to read at once
+
+    Returns:
+    (generator) -- generator of strings, each consisting of whole lines
+    """
+
+    rest = "" # incomplete last line of the previous block
+    while True:
+        text = f.read(size)
+        if text == "":
+            break
+        text = rest + text
+        k = text.rfind("\n") + 1 # end of the last complete line
+        rest = text[k:]
+        if k > 0:
+            yield text[:k]
+    if rest != "":
+        yield rest
 
 #=============================================================================
 # Public functions
 #=============================================================================
 
-def misspell_string(s, mode=0, config=_DEF_CONFIG, silent=False,
+def misspell_string(s, mode=0, config=_DEF_CONFIG, silent=False, jobs=1,
     _rules=None):
-    """misspell_string(s[, mode][, config][, silent]) -> str
+    """misspell_string(s[, mode][, config][, silent][, jobs]) -> str
     Returns a misspelled version of a given string.
     
     Positional arguments:
@@ -1068,10 +1602,11 @@ def misspell_string(s, mode=0, config=_DEF_CONFIG, silent=False,
     [config="settings.ini"] (str) -- config file name to control parameters
         (defaults to standard config file, or None to skip the file loading)
     [silent=False] (bool) -- whether to print progress messages to the screen
-    [_rules=None] (configparser.ConfigParser) -- config parser of letter group
-        and forbidden substring dictionaries for phonological misspelling
-        rules, normally expected to be passed by misspell_file; file loaded by
-        this function if None
+    [jobs=1] (int) -- number of worker processes used to misspell separate
+        lines in parallel
+    [_rules=None] (dict) -- dictionary of letter group and forbidden
+        substring dictionaries for phonological misspelling rules, if
+        already loaded; file loaded by this function if None
     
     Returns:
     (str) -- misspelled version of string
@@ -1082,13 +1617,14 @@ def misspell_string(s, mode=0, config=_DEF_CONFIG, silent=False,
         if silent == False:
             print("unrecognized mode index; defaulting to 0 ('all')")
         mode = 0
-    if type(s) != str:
+    if not isinstance(s, str):
         sys.exit("input must be a string")
-    if type(config) != str and config != None:
+    if config != None and not isinstance(config, str):
         sys.exit("config file name must be a string or None")
-    if (type(_rules) != type(configparser.ConfigParser())
-        and _rules != None):
-        sys.exit("rules option must be a ConfigParser or None")
+    if type(jobs) != int or jobs < 1:
+        sys.exit("number of jobs must be a positive integer")
+    if _rules != None and not isinstance(_rules, dict):
+        sys.exit("rules option must be a dictionary or None")
     
     # Set config file (does nothing if no change)
     if config != None:
@@ -1098,45 +1634,20 @@ def misspell_string(s, mode=0, config=_DEF_CONFIG, silent=False,
     rules = _rules
     if rules == None and mode in {0, 1}:
         rules = _read_rules(silent=silent)
+    elif rules != None and "forbidden" not in rules and mode in {0, 1}:
+        # Build the forbidden substring tables from the given rule sections
+        # (rules from _read_rules already include them)
+        rules = dict(rules)
+        rules["forbidden"] = _forbidden_tables(rules)
     
-    # Translate line-by-line and word-by-word
-    out_text = "" # complete output string
-    for line in s.split('\n'):
-        out_line = "" # complete line of output string
-        line_part = re.split(r'(\s+)', line) # word and whitespace clusters
-        for word in line_part:
-            # Misspell word
-            out_line += _misspell_word(word, mode=mode, rules=rules)
-        # Apply final typographical errors
-        if mode in {0, 2}:
-            # Random character swaps
-            for i in range(len(out_line)-1):
-                # Get two consecutive letters
-                c1, c2 = out_line[i], out_line[i+1]
-                # Skip if characters are not compatible
-                if _can_swap(c1, c2) == False:
-                    continue
-                # Otherwise roll for random swap
-                if random.random() < _TYPO_SWAP:
-                    out_line = (("", out_line[:i])[i > 0] + c2 + c1 +
-                                ("", out_line[i+2:])[i < len(out_line)-1])
-        # Run a final check for blacklisted words
-        for w in _BLACKLIST:
-            # Attempt to find the blacklisted word
-            while out_text.lower().find(w.lower()) >= 0:
-                # If present, delete its last character
-                pos = out_text.lower().find(w.lower()) + len(w) - 1
-                out_text = out_text[:pos] + out_text[pos+1:]
-                    
-        out_text += out_line + '\n'
-    
-    return out_text[:-1]
+    # Translate the string
+    return _misspell_text(s, mode=mode, rules=rules, jobs=jobs)
 
 #-----------------------------------------------------------------------------
 
 def misspell_file(fin, fout=None, mode=0, config=_DEF_CONFIG,
-                  silent=False):
-    """misspell_file(fin[, fout][, mode][, config][, silent])
+                  silent=False, jobs=1):
+    """misspell_file(fin[, fout][, mode][, config][, silent][, jobs])
     Writes a misspelled version of a given text file.
     
     Attempts to read a text file and misspell each word one-by-one. The result
@@ -1152,6 +1663,8 @@ def misspell_file(fin, fout=None, mode=0, config=_DEF_CONFIG,
     [config="settings.ini"] (str) -- config file name to control parameters
         (defaults to standard config file, or None to skip the file loading)
     [silent=False] (bool) -- whether to print progress messages to the screen
+    [jobs=1] (int) -- number of worker processes used to misspell separate
+        lines in parallel
     """
     
     # Validate inputs
@@ -1159,12 +1672,14 @@ def misspell_file(fin, fout=None, mode=0, config=_DEF_CONFIG,
         if silent == False:
             print("unrecognized mode index; defaulting to 0 ('all')")
         mode = 0
-    if type(fin) != str:
+    if not isinstance(fin, str):
         sys.exit("input argument must be a file name string")
-    if type(fout) != str and fout != None:
+    if fout != None and not isinstance(fout, str):
         sys.exit("output argument must be a file name string or None")
-    if type(config) != str and config != None:
+    if config != None and not isinstance(config, str):
         sys.exit("config file name must be a string or None")
+    if type(jobs) != int or jobs < 1:
+        sys.exit("number of jobs must be a positive integer")
     
     # Set config file (does nothing if no change)
     if config != None:
@@ -1175,28 +1690,57 @@ def misspell_file(fin, fout=None, mode=0, config=_DEF_CONFIG,
     if mode in {0, 1}:
         rules = _read_rules(silent=silent)
     
-    # Translate file line-by-line
+    # Open input file
     try:
-        with open(fin, 'r') as f:
-            # If file is found, translate line-by-line
-            if silent == False:
-                print("Converting input file '" + fin + "' ...")
-            out_text = "" # complete output string
-            for line in f:
-                # Call string misspeller for each line
-                out_text += misspell_string(line, mode=mode, config=None,
-                                            silent=silent, _rules=rules)
+        f = open(fin, 'r', buffering=_FILE_BUFFER)
     except FileNotFoundError:
         sys.exit("input file " + fin + " not found")
     
-    # Write output string to a file or print to the screen
-    if fout == None:
-        print('\n' + '>'*10 + '\n\n' + out_text)
-    else:
-        with open(fout, 'w') as f:
-            f.write(out_text)
-            if silent == False:
-                print("Output file '" + fout + "' written.")
+    # Translate file line-by-line
+    with f:
+        if silent == False:
+            print("Converting input file '" + fin + "' ...")
+        
+        # Call string misspeller for large blocks of lines at once (sending
+        # smaller blocks to worker processes if running in parallel)
+        ex = None # worker process pool
+        if jobs > 1:
+            ex = concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker,
+                initargs=(_get_params(), rules))
+            out_parts = _pool_map(ex, _read_chunks(f, size=_FILE_CHUNK),
+                                  mode, 2*jobs)
+        else:
+            out_parts = (_misspell_text(text, mode=mode, rules=rules)
+                         for text in _read_chunks(f))
+        
+        try:
+            # Print output string to the screen
+            if fout == None:
+                print('\n' + '>'*10 + '\n\n' + "".join(out_parts))
+                return None
+            
+            # Otherwise stream each part to a temporary file beside the output
+            # file as it is converted, and only replace the output file once
+            # it is complete (so that fin may safely equal fout)
+            target = os.path.realpath(fout)
+            tmp = target + "." + str(os.getpid()) + ".tmp"
+            try:
+                with open(tmp, 'x', buffering=_FILE_BUFFER) as g:
+                    for text in out_parts:
+                        g.write(text)
+                if os.path.exists(target) == True:
+                    os.chmod(tmp, os.stat(target).st_mode & 0o7777)
+                os.replace(tmp, target)
+            except BaseException:
+                if os.path.exists(tmp) == True:
+                    os.remove(tmp)
+                raise
+        finally:
+            if ex != None:
+                ex.shutdown()
+    if silent == False:
+        print("Output file '" + fout + "' written.")
 
 #=============================================================================
 # Command line usage
@@ -1224,6 +1768,8 @@ if __name__ == "__main__" and len(sys.argv) > 1:
                               "misspelled rather than a file path"))
     parser.add_argument("-q", "--quiet", action="store_true", dest="silent",
                         help="silence progress messages")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of worker processes (default 1)")
     group.add_argument("-p", "--phono", action="store_true",
                        help="apply only phonological misspelling rules")
     group.add_argument("-t", "--typo", action="store_true",
@@ -1240,7 +1786,7 @@ if __name__ == "__main__" and len(sys.argv) > 1:
         mode = 2
     if args.string == True:
         s = misspell_string(args.instring, mode=mode, config=args.config,
-                            silent=args.silent)
+                            silent=args.silent, jobs=args.jobs)
         if args.outstring == None:
             print(s)
         else:
@@ -1250,4 +1796,4 @@ if __name__ == "__main__" and len(sys.argv) > 1:
                     print("Output file '" + args.outstring + "' written.")
     else:
         misspell_file(args.instring, args.outstring, mode=mode,
-                      config=args.config, silent=args.silent)
+                      config=args.config, silent=args.silent, jobs=args.jobs)